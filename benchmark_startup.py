@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure service cold start: import time and time to first successful request.
+
+Run from a service directory (or inside its container via `make bench-startup`).
+Prints one JSON line per run so results can be appended and tracked over time.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+IMPORT_CODE = (
+    "import time; start = time.perf_counter(); import main; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure_import_time(runs):
+    """Best-of-N wall time to import the service's main module in a fresh process"""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def measure_first_request(port, path, timeout):
+    """Time from launching uvicorn to the first 200 response on path"""
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(
+                    f"http://127.0.0.1:{port}{path}", timeout=1
+                ) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"No successful response from {path} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--service", required=True)
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--path", default="/health/live")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    result = {
+        "service": args.service,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "import_seconds": round(measure_import_time(args.runs), 4),
+        "first_request_seconds": round(
+            measure_first_request(args.port, args.path, args.timeout), 4
+        ),
+    }
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Add summary to document_metadata
+
+Revision ID: 003_add_summary
+Revises: 002_add_client_id
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "003_add_summary"
+down_revision = "002_add_client_id"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add summary column; large values are TOASTed out of line by Postgres
+    op.add_column(
+        "document_metadata",
+        sa.Column("summary", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    # Drop the summary column
+    op.drop_column("document_metadata", "summary")
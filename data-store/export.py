@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import queue
+import threading
+import zlib
+from contextlib import suppress
+from typing import AsyncIterator, List
+
+from database import export_engine, settings
+from fastapi.responses import StreamingResponse
+from psycopg2 import sql
+
+logger = logging.getLogger(__name__)
+
+# Memory held per export is bounded by CHUNK_SIZE * MAX_BUFFERED_CHUNKS
+CHUNK_SIZE = 64 * 1024
+MAX_BUFFERED_CHUNKS = 8
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+_DONE = object()
+
+# Each export holds a Postgres connection and a COPY for its whole duration
+export_slots = asyncio.Semaphore(settings.max_concurrent_exports)
+
+
+class ExportCancelled(Exception):
+    """Raised inside COPY when the consumer has gone away"""
+
+
+class QueueWriter:
+    """File-like sink for copy_expert that hands chunks to a bounded queue.
+
+    put() blocks while the queue is full, so COPY only reads from Postgres as
+    fast as the HTTP client consumes the response.
+    """
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self.chunks = chunks
+        self.cancelled = cancelled
+        self.buffer = bytearray()
+
+    def write(self, data) -> None:
+        if isinstance(data, str):
+            data = data.encode()
+        self.buffer += data
+        if len(self.buffer) >= CHUNK_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.put(bytes(self.buffer))
+            self.buffer.clear()
+
+    def put(self, item) -> None:
+        while True:
+            if self.cancelled.is_set():
+                raise ExportCancelled()
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q=0 refusals"""
+    qualities = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def build_export_statement(
+    client_id: str, fields: List[str], since: int, export_format: str
+) -> sql.Composed:
+    """Build the COPY ... TO STDOUT statement for a client's documents"""
+    if export_format == "ndjson":
+        # Build each JSON document in Postgres. CSV format with quote and
+        # delimiter characters that JSON always escapes emits it verbatim.
+        columns = sql.SQL("json_build_object({})::text").format(
+            sql.SQL(", ").join(
+                sql.SQL("{}, {}").format(sql.Literal(field), sql.Identifier(field))
+                for field in fields
+            )
+        )
+        options = sql.SQL(r"FORMAT csv, QUOTE E'\x01', DELIMITER E'\x02'")
+    else:
+        columns = sql.SQL(", ").join(sql.Identifier(field) for field in fields)
+        options = sql.SQL("FORMAT csv, HEADER")
+
+    return sql.SQL(
+        "COPY (SELECT {columns} FROM document_metadata"
+        " WHERE client_id = {client_id} AND id > {since} ORDER BY id)"
+        " TO STDOUT WITH ({options})"
+    ).format(
+        columns=columns,
+        client_id=sql.Literal(client_id),
+        since=sql.Literal(since),
+        options=options,
+    )
+
+
+def _run_copy(connection, statement: sql.Composed, writer: QueueWriter) -> None:
+    """Run COPY on a dedicated connection, feeding the writer until done"""
+    result = _DONE
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(statement.as_string(cursor), writer)
+        writer.flush()
+    except Exception as e:
+        # The connection is still mid-COPY: stop the query server-side and
+        # drop the connection rather than letting a reset drain the rest
+        with suppress(Exception):
+            connection.dbapi_connection.cancel()
+        connection.invalidate()
+        if isinstance(e, ExportCancelled):
+            return
+        result = e
+    finally:
+        connection.close()
+
+    try:
+        writer.put(result)
+    except ExportCancelled:
+        pass
+
+
+class CopyExport:
+    """A COPY ... TO STDOUT running in a worker thread on its own connection.
+
+    Chunks are read through a bounded queue. cancel() stops the COPY whether
+    or not the response ever started reading.
+    """
+
+    def __init__(self, connection, statement: sql.Composed):
+        self.chunks = queue.Queue(maxsize=MAX_BUFFERED_CHUNKS)
+        self.cancelled = threading.Event()
+        writer = QueueWriter(self.chunks, self.cancelled)
+        threading.Thread(
+            target=_run_copy, args=(connection, statement, writer), daemon=True
+        ).start()
+
+    async def next_chunk(self):
+        return await asyncio.to_thread(self.chunks.get)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        # Wakes a next_chunk() left waiting in its thread by cancellation
+        with suppress(queue.Full):
+            self.chunks.put_nowait(_DONE)
+
+
+async def start_export(
+    client_id: str, fields: List[str], since: int, export_format: str
+) -> CopyExport:
+    """Connect and start the COPY, raising if Postgres cannot be reached"""
+    statement = build_export_statement(client_id, fields, since, export_format)
+    connection = await asyncio.to_thread(export_engine.raw_connection)
+    return CopyExport(connection, statement)
+
+
+async def stream_export(
+    export: CopyExport, client_id: str, since: int, compress: bool = False
+) -> AsyncIterator[bytes]:
+    """Stream an export's NDJSON or CSV output, optionally gzipped"""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    try:
+        while True:
+            chunk = await export.next_chunk()
+            if chunk is _DONE:
+                break
+            if isinstance(chunk, Exception):
+                logger.error(f"Export failed for client {client_id}: {str(chunk)}")
+                raise chunk
+            if compressor:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield chunk
+
+        if compressor:
+            yield compressor.flush()
+        logger.info(f"Exported documents for client {client_id} since ID {since}")
+    finally:
+        # Stops the COPY if the client went away mid-stream
+        export.cancel()
+
+
+class ExportResponse(StreamingResponse):
+    """Streams an export and releases it as soon as the request ends.
+
+    Starlette only finalises an abandoned body iterator when it is garbage
+    collected, so stop the COPY here to react to client disconnects.
+    """
+
+    def __init__(self, export: CopyExport, content, **kwargs):
+        super().__init__(content, **kwargs)
+        self.export = export
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
+            self.export.cancel()
+            export_slots.release()
@@ -1,27 +1,126 @@
+import asyncio
 import logging
-
-import models
-from database import engine, get_db
-from fastapi import Depends, FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from typing import List, Literal, Optional
+
+from database import get_db, ping_database, pool_has_capacity, settings
+from export import (
+    MEDIA_TYPES,
+    ExportResponse,
+    accepts_gzip,
+    export_slots,
+    start_export,
+    stream_export,
+)
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from health import HealthProber
 from models import DocumentMetadata
-from schemas import DocumentMetadataCreate, DocumentMetadataResponse
-from sqlalchemy.orm import Session
+from schemas import (
+    DocumentMetadataCreate,
+    DocumentMetadataResponse,
+    DocumentMetadataSparseResponse,
+)
+from sqlalchemy.orm import Session, load_only
+from telemetry import init_metrics
+
+# Schema is managed by Alembic (`alembic upgrade head`), never at import time
+
+
+async def check_database() -> bool:
+    return await asyncio.to_thread(ping_database)
+
+
+async def check_database_pool() -> bool:
+    return pool_has_capacity()
+
+
+prober = HealthProber(
+    {"database": check_database, "database_pool": check_database_pool},
+    interval=settings.health_probe_interval,
+    timeout=settings.health_probe_timeout,
+)
 
-# Create tables
-models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Data Store API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The OTEL SDK and gRPC exporter are slow to import; set them up in the
+    # background so they do not delay the first request
+    metrics_setup = asyncio.create_task(asyncio.to_thread(init_metrics))
+    prober.start()
+    yield
+    await prober.stop()
+    try:
+        meter_provider = await metrics_setup
+    except Exception as e:
+        logger.error(f"Metrics setup failed: {str(e)}")
+    else:
+        meter_provider.shutdown()
+
+
+app = FastAPI(title="Data Store API", version="1.0.0", lifespan=lifespan)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fields returned when no ?fields= is given; summary is opt-in as it can be large
+ALL_FIELDS = list(DocumentMetadataResponse.model_fields)
+DEFAULT_FIELDS = [field for field in ALL_FIELDS if field != "summary"]
+
+
+def parse_fields(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated list of fields to return"
+    ),
+) -> List[str]:
+    """Dependency to parse a sparse fieldset from the ?fields= query parameter"""
+    requested = [field.strip() for field in (fields or "").split(",") if field.strip()]
+    if not requested:
+        return DEFAULT_FIELDS
+
+    unknown = [field for field in requested if field not in ALL_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return requested
+
+
+def select_fields(query, fields: List[str]):
+    """Restrict a DocumentMetadata query to the columns in the fieldset"""
+    return query.options(
+        load_only(*(getattr(DocumentMetadata, field) for field in fields))
+    )
+
+
+def serialize_document(document: DocumentMetadata, fields: List[str]) -> dict:
+    """Encode only the requested fields so deferred columns are never loaded"""
+    return jsonable_encoder({field: getattr(document, field) for field in fields})
+
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "data-store"}
+    """Health check endpoint, answered from the last background probe"""
+    return {"service": "data-store", **prober.snapshot()}
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive", "service": "data-store"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: dependencies were healthy at the last background probe"""
+    return JSONResponse(
+        status_code=200 if prober.ready else 503,
+        content={"service": "data-store", **prober.snapshot()},
+    )
+
+
+# Always returns DEFAULT_FIELDS, i.e. everything except the summary
 @app.post("/clients/{client_id}/documents", response_model=DocumentMetadataResponse)
 async def create_client_document_metadata(
     client_id: str, document: DocumentMetadataCreate, db: Session = Depends(get_db)
@@ -34,28 +133,103 @@ async def create_client_document_metadata(
         db_document = DocumentMetadata(**document_data)
         db.add(db_document)
         db.commit()
-        db.refresh(db_document)
+        db.refresh(db_document, attribute_names=DEFAULT_FIELDS)
 
         logger.info(
-            f"Stored metadata for document: {db_document.filename} (client: {client_id})"
+            f"Stored metadata for document: {document.filename} (client: {client_id})"
         )
-        return db_document
+        return JSONResponse(content=serialize_document(db_document, DEFAULT_FIELDS))
     except Exception as e:
         logger.error(f"Error storing document metadata: {str(e)}")
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to store document metadata")
 
 
+@app.get(
+    "/clients/{client_id}/documents",
+    response_model=List[DocumentMetadataSparseResponse],
+)
+async def list_document_metadata(
+    client_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    fields: List[str] = Depends(parse_fields),
+):
+    """List document metadata for a specific client"""
+    documents = (
+        select_fields(db.query(DocumentMetadata), fields)
+        .filter(DocumentMetadata.client_id == client_id)
+        .order_by(DocumentMetadata.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return JSONResponse(
+        content=[serialize_document(document, fields) for document in documents]
+    )
+
+
+@app.get("/clients/{client_id}/documents/export")
+async def export_document_metadata(
+    request: Request,
+    client_id: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    since: int = Query(
+        0, ge=0, description="Only export documents with an ID greater than this"
+    ),
+    fields: List[str] = Depends(parse_fields),
+):
+    """Stream all document metadata for a client, ordered by ID"""
+    if export_slots.locked():
+        raise HTTPException(
+            status_code=429,
+            detail="Too many concurrent exports",
+            headers={"Retry-After": "30"},
+        )
+
+    # id is always exported so an interrupted export can resume with ?since=
+    if "id" not in fields:
+        fields = ["id", *fields]
+
+    compress = accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {"Content-Encoding": "gzip"} if compress else {}
+
+    # Released by ExportResponse once the stream finishes or the client leaves
+    await export_slots.acquire()
+    export = None
+    try:
+        # Connect before responding so an unreachable database is a 503, not
+        # a 200 whose body never arrives
+        export = await start_export(client_id, fields, since, format)
+    except Exception as e:
+        logger.error(f"Error starting export for client {client_id}: {str(e)}")
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    finally:
+        if export is None:
+            export_slots.release()
+
+    return ExportResponse(
+        export,
+        stream_export(export, client_id, since, compress),
+        media_type=MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
 @app.get(
     "/clients/{client_id}/documents/{document_id}",
-    response_model=DocumentMetadataResponse,
+    response_model=DocumentMetadataSparseResponse,
 )
 async def get_document_metadata(
-    client_id: str, document_id: int, db: Session = Depends(get_db)
+    client_id: str,
+    document_id: int,
+    db: Session = Depends(get_db),
+    fields: List[str] = Depends(parse_fields),
 ):
     """Retrieve document metadata by client ID and document ID"""
     document = (
-        db.query(DocumentMetadata)
+        select_fields(db.query(DocumentMetadata), fields)
         .filter(
             DocumentMetadata.client_id == client_id, DocumentMetadata.id == document_id
         )
@@ -64,7 +238,7 @@ async def get_document_metadata(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return document
+    return JSONResponse(content=serialize_document(document, fields))
 
 
 if __name__ == "__main__":
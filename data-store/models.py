@@ -1,5 +1,6 @@
-from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -18,3 +19,5 @@ class DocumentMetadata(Base):
     content_type = Column(String, nullable=True)
     upload_timestamp = Column(DateTime(timezone=True), server_default=func.now())
     file_path = Column(String, nullable=True)  # Optional: where file is stored
+    # LLM summaries can be several KB; only loaded when explicitly requested
+    summary = deferred(Column(Text, nullable=True))
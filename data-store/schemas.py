@@ -11,6 +11,7 @@ class DocumentMetadataCreate(BaseModel):
     file_type: str
     content_type: Optional[str] = None
     file_path: Optional[str] = None
+    summary: Optional[str] = None
 
 
 class DocumentMetadataResponse(BaseModel):
@@ -22,6 +23,24 @@ class DocumentMetadataResponse(BaseModel):
     content_type: Optional[str] = None
     upload_timestamp: datetime
     file_path: Optional[str] = None
+    summary: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+
+class DocumentMetadataSparseResponse(BaseModel):
+    """Document metadata restricted to a ?fields= sparse fieldset.
+
+    Every field is optional since only the requested ones are returned.
+    """
+
+    id: Optional[int] = None
+    client_id: Optional[str] = None
+    filename: Optional[str] = None
+    file_size: Optional[int] = None
+    file_type: Optional[str] = None
+    content_type: Optional[str] = None
+    upload_timestamp: Optional[datetime] = None
+    file_path: Optional[str] = None
+    summary: Optional[str] = None
@@ -0,0 +1,36 @@
+import os
+
+
+def init_metrics():
+    """Export OpenTelemetry metrics (e.g. health probe latency) over OTLP.
+
+    Meters created before this runs via metrics.get_meter() are proxies and
+    start exporting once the provider is set. Returns the provider so the
+    caller can flush it on shutdown.
+    """
+    # SDK and gRPC exporter are slow to import, so load them from the lifespan
+    from opentelemetry import metrics
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+        OTLPMetricExporter,
+    )
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+
+    service_name = os.environ.get("OTEL_SERVICE_NAME", "data-store")
+    service_version = os.environ.get("OTEL_SERVICE_VERSION", "1.0.0")
+    endpoint = os.environ.get(
+        "OTEL_EXPORTER_OTLP_ENDPOINT", "http://otel-collector:4317"
+    )
+    insecure = os.environ.get("OTEL_EXPORTER_OTLP_INSECURE", "false") == "true"
+
+    resource = Resource.create(
+        {"service.name": service_name, "service.version": service_version}
+    )
+    metric_reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=endpoint, insecure=insecure),
+        export_interval_millis=5000,
+    )
+    meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
+    metrics.set_meter_provider(meter_provider)
+    return meter_provider
@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     data_store_url: str = os.getenv("DATA_STORE_URL", "http://localhost:8001")
+    health_probe_interval: float = 10.0
+    health_probe_timeout: float = 2.0
 
     class Config:
         env_file = ".env"
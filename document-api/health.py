@@ -0,0 +1,96 @@
+# Deliberate copy of data-store/health.py (the services share no package); keep the
+# two files identical.
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable, Dict, Optional
+
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+probe_latency_hist = meter.create_histogram("health_probe_duration_seconds", unit="s")
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[], Awaitable[bool]]
+
+# Readiness lapses once the last completed probe is this many intervals old
+STALE_AFTER_INTERVALS = 3
+
+
+class HealthProber:
+    """Refreshes dependency status on an interval in the background.
+
+    Health endpoints read the cached status instead of calling dependencies
+    themselves, so their cost does not grow with the number of monitors.
+    """
+
+    def __init__(
+        self, checks: Dict[str, HealthCheck], interval: float, timeout: float
+    ):
+        self.checks = checks
+        self.interval = interval
+        self.timeout = timeout
+        self.dependencies: Dict[str, bool] = {name: False for name in checks}
+        self.last_checked: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last completed probe round"""
+        if self.last_checked is None:
+            return None
+        return time.time() - self.last_checked
+
+    @property
+    def stale(self) -> bool:
+        """Whether the probe loop has stopped refreshing the cached status"""
+        age = self.age
+        return age is None or age > STALE_AFTER_INTERVALS * self.interval + self.timeout
+
+    @property
+    def ready(self) -> bool:
+        return not self.stale and all(self.dependencies.values())
+
+    async def probe(self, name: str, check: HealthCheck) -> None:
+        start = time.perf_counter()
+        try:
+            healthy = await asyncio.wait_for(check(), self.timeout)
+        except Exception as e:
+            logger.warning(f"Health probe {name} failed: {str(e) or type(e).__name__}")
+            healthy = False
+        elapsed = time.perf_counter() - start
+
+        probe_latency_hist.record(elapsed, {"dependency": name, "healthy": healthy})
+        self.dependencies[name] = healthy
+
+    async def refresh(self) -> None:
+        await asyncio.gather(
+            *(self.probe(name, check) for name, check in self.checks.items())
+        )
+        self.last_checked = time.time()
+
+    async def run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def snapshot(self) -> dict:
+        return {
+            "status": "healthy" if self.ready else "unhealthy",
+            "dependencies": dict(self.dependencies),
+            "last_checked": self.last_checked,
+            "age": None if self.age is None else round(self.age, 3),
+            "stale": self.stale,
+        }
@@ -1,18 +1,45 @@
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Literal, Optional
 import time
 import httpx
-import magic
 from config import get_settings
-from fastapi import Depends, FastAPI, File, HTTPException, UploadFile, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, File, HTTPException, Query, UploadFile, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from health import HealthProber
 from opentelemetry import metrics, trace
 from telemetry import init_observability
 
+settings = get_settings()
+# Shared by the background prober; health requests never open their own client
+health_client = httpx.AsyncClient(timeout=settings.health_probe_timeout)
 
-app = FastAPI(title="Document API", version="1.0.0")
+
+async def check_data_store() -> bool:
+    response = await health_client.get(f"{settings.data_store_url}/health/ready")
+    return response.status_code == 200
+
+
+prober = HealthProber(
+    {"data_store": check_data_store},
+    interval=settings.health_probe_interval,
+    timeout=settings.health_probe_timeout,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_observability()
+    prober.start()
+    yield
+    await prober.stop()
+    await health_client.aclose()
+
+
+app = FastAPI(title="Document API", version="1.0.0", lifespan=lifespan)
 meter = metrics.get_meter(__name__)
 request_counter = meter.create_counter("http_server_requests_total", unit="1")
 latency_hist = meter.create_histogram("http_server_request_duration_seconds", unit="s")
@@ -48,16 +75,24 @@ async def record_metrics(request: Request, call_next):
     return response
 
 @app.get("/health")
-async def health_check(settings=Depends(get_settings)):
-    deps = {}
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{settings.data_store_url}/health", timeout=5)
-            deps["data_store"] = resp.status_code == 200
-    except Exception:
-        deps["data_store"] = False
-    status = "healthy" if all(deps.values()) else "unhealthy"
-    return {"status": status, "service": "document-api", "dependencies": deps}
+async def health_check():
+    """Health check answered from the last background probe."""
+    return {"service": "document-api", **prober.snapshot()}
+
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive", "service": "document-api"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: dependencies were healthy at the last background probe."""
+    return JSONResponse(
+        status_code=200 if prober.ready else 503,
+        content={"service": "document-api", **prober.snapshot()},
+    )
 
 
 async def summarise_document_using_llm(file_path):
@@ -65,10 +100,40 @@ async def summarise_document_using_llm(file_path):
         await asyncio.sleep(10)
         return "This is a summary of the document."
 
-# in upload_document(...)
-with tracer.start_as_current_span("store_metadata", attributes={"client_id": client_id, "file_name": file.filename}):
-    response = await client.post(...)
-upload_counter.add(1, {"client_id": client_id})
+
+def detect_file_type(content: bytes) -> str:
+    """Sniff the MIME type; libmagic is loaded on the first upload, not at startup."""
+    import magic
+
+    return magic.from_buffer(content, mime=True)
+
+
+class RelayResponse(StreamingResponse):
+    """Relays an upstream httpx stream and closes it as soon as the request ends.
+
+    Raw bytes are passed through untouched, so gzip from the data-store is
+    preserved. Closing here rather than when the body iterator is finalised
+    stops the upstream export as soon as the downstream client disconnects.
+    """
+
+    def __init__(
+        self, upstream: httpx.Response, client: httpx.AsyncClient, **kwargs
+    ):
+        super().__init__(upstream.aiter_raw(), **kwargs)
+        self.upstream = upstream
+        self.client = client
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.upstream.aclose()
+            await self.client.aclose()
+
+
+def fields_params(fields: Optional[str]) -> dict:
+    """Forward a ?fields= sparse fieldset to the data-store when one was given."""
+    return {"fields": fields} if fields else {}
 
 
 @app.put("/clients/{client_id}/upload-document")
@@ -81,7 +146,7 @@ async def upload_document(
         content = await file.read()
         file_size = len(content)
 
-        file_type = magic.from_buffer(content, mime=True)
+        file_type = detect_file_type(content)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_filename = f"{client_id}_{timestamp}_{file.filename}"
@@ -101,11 +166,12 @@ async def upload_document(
         }
 
         async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.data_store_url}/clients/{client_id}/documents",
-                json=metadata,
-                timeout=30.0,
-            )
+            with tracer.start_as_current_span("store_metadata", attributes={"client_id": client_id, "file_name": file.filename}):
+                response = await client.post(
+                    f"{settings.data_store_url}/clients/{client_id}/documents",
+                    json=metadata,
+                    timeout=30.0,
+                )
 
             if response.status_code != 200:
                 logger.error(f"Failed to store metadata: {response.text}")
@@ -115,6 +181,7 @@ async def upload_document(
 
             stored_metadata = response.json()
 
+        upload_counter.add(1, {"client_id": client_id})
         logger.info(
             f"Successfully uploaded document: {file.filename} for client: {client_id}"
         )
@@ -139,20 +206,119 @@ async def upload_document(
         if file_path and file_path.exists():
             file_path.unlink()
 
+@app.get("/clients/{client_id}/documents")
+async def list_document_metadata(
+    client_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    fields: Optional[str] = None,
+    settings=Depends(get_settings),
+):
+    """List document metadata for a specific client."""
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{settings.data_store_url}/clients/{client_id}/documents",
+                params={"limit": limit, "offset": offset, **fields_params(fields)},
+                timeout=30.0,
+            )
+
+            if response.status_code == 400:
+                raise HTTPException(status_code=400, detail=response.json()["detail"])
+            elif response.status_code != 200:
+                logger.error(f"Failed to list metadata: {response.text}")
+                raise HTTPException(
+                    status_code=500, detail="Failed to list document metadata"
+                )
+
+            documents = response.json()
+
+        logger.info(f"Listed {len(documents)} documents (client: {client_id})")
+        return documents
+
+    except httpx.RequestError as e:
+        logger.error(f"Error communicating with data-store: {str(e)}")
+        raise HTTPException(status_code=503, detail="Data store service unavailable")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error listing document metadata: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to list document metadata")
+
+
+@app.get("/clients/{client_id}/documents/export")
+async def export_document_metadata(
+    request: Request,
+    client_id: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    since: int = Query(0, ge=0),
+    fields: Optional[str] = None,
+    settings=Depends(get_settings),
+):
+    """Stream all document metadata for a client from the data-store."""
+    # The read timeout only runs while waiting on the data-store, not while a
+    # slow downstream consumer holds up the next read, so a stalled export fails
+    client = httpx.AsyncClient(timeout=30.0)
+    upstream = client.build_request(
+        "GET",
+        f"{settings.data_store_url}/clients/{client_id}/documents/export",
+        params={"format": format, "since": since, **fields_params(fields)},
+        headers={"Accept-Encoding": request.headers.get("accept-encoding", "identity")},
+    )
+    try:
+        response = await client.send(upstream, stream=True)
+    except httpx.RequestError as e:
+        await client.aclose()
+        logger.error(f"Error communicating with data-store: {str(e)}")
+        raise HTTPException(status_code=503, detail="Data store service unavailable")
+
+    if response.status_code != 200:
+        await response.aread()
+        await response.aclose()
+        await client.aclose()
+        if response.status_code in (400, 429, 503):
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=response.json()["detail"],
+                headers={
+                    k: v for k, v in response.headers.items() if k == "retry-after"
+                },
+            )
+        logger.error(f"Failed to export metadata: {response.text}")
+        raise HTTPException(
+            status_code=500, detail="Failed to export document metadata"
+        )
+
+    logger.info(f"Exporting documents for client: {client_id} since ID {since}")
+    headers = {}
+    if "content-encoding" in response.headers:
+        headers["Content-Encoding"] = response.headers["content-encoding"]
+
+    return RelayResponse(
+        response, client, media_type=response.headers["content-type"], headers=headers
+    )
+
+
 @app.get("/clients/{client_id}/documents/{document_id}")
 async def retrieve_document_metadata(
-    client_id: str, document_id: int, settings=Depends(get_settings)
+    client_id: str,
+    document_id: int,
+    fields: Optional[str] = None,
+    settings=Depends(get_settings),
 ):
     """Retrieve document metadata by client ID and document ID."""
     try:
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 f"{settings.data_store_url}/clients/{client_id}/documents/{document_id}",
+                params=fields_params(fields),
                 timeout=30.0,
             )
 
             if response.status_code == 404:
                 raise HTTPException(status_code=404, detail="Document not found")
+            elif response.status_code == 400:
+                raise HTTPException(status_code=400, detail=response.json()["detail"])
             elif response.status_code != 200:
                 logger.error(f"Failed to retrieve metadata: {response.text}")
                 raise HTTPException(
@@ -178,8 +344,6 @@ async def retrieve_document_metadata(
         )
 
 
-init_observability()
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -4,6 +4,7 @@
 import json
 import os
 import tempfile
+import time
 from pathlib import Path
 
 import requests
@@ -32,6 +33,15 @@ def test_health_endpoints():
         response = requests.get("http://localhost:8001/health", timeout=10)
         print(f"Data Store health: {response.status_code} - {response.json()}")
 
+        for path in ("/health/live", "/health/ready"):
+            start = time.perf_counter()
+            response = requests.get(f"{BASE_URL}{path}", timeout=10)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(
+                f"Document API {path}: {response.status_code} in {elapsed:.1f} ms"
+                f" - {response.json()}"
+            )
+
     except requests.RequestException as e:
         print(f"Health check failed: {e}")
 
@@ -96,6 +106,86 @@ def test_retrieve_metadata(document_id):
         print(f"Metadata retrieval request failed: {e}")
 
 
+def test_sparse_fields(document_id):
+    """Compare response size and latency with and without the summary field"""
+    if not document_id:
+        print("No document ID to test sparse fieldsets")
+        return
+
+    print(f"\nTesting sparse fieldsets for document ID {document_id}...")
+
+    url = f"{BASE_URL}/clients/{TEST_CLIENT_ID}/documents/{document_id}"
+    variants = {
+        "default": {},
+        "with summary": {"fields": "id,filename,summary"},
+        "id only": {"fields": "id"},
+    }
+
+    try:
+        for name, params in variants.items():
+            timings = []
+            for _ in range(20):
+                start = time.perf_counter()
+                response = requests.get(url, params=params, timeout=10)
+                timings.append(time.perf_counter() - start)
+
+            if response.status_code != 200:
+                print(f"{name}: {response.status_code} - {response.text}")
+                continue
+
+            timings.sort()
+            print(
+                f"{name}: {len(response.content)} bytes, "
+                f"median {timings[len(timings) // 2] * 1000:.1f} ms, "
+                f"fields {sorted(response.json())}"
+            )
+
+        response = requests.get(url, params={"fields": "nope"}, timeout=10)
+        if response.status_code == 400:
+            print("✅ Unknown fields rejected")
+        else:
+            print(f"❌ Unknown fields accepted: {response.status_code}")
+
+    except requests.RequestException as e:
+        print(f"Sparse fieldset test request failed: {e}")
+
+
+def test_export(document_id):
+    """Test streaming export and resuming from a since cursor"""
+    if not document_id:
+        print("No document ID to test export")
+        return
+
+    print(f"\nTesting metadata export for client {TEST_CLIENT_ID}...")
+
+    url = f"{BASE_URL}/clients/{TEST_CLIENT_ID}/documents/export"
+
+    try:
+        with requests.get(url, stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                print(f"Export failed: {response.status_code} - {response.text}")
+                return
+            rows = [json.loads(line) for line in response.iter_lines() if line]
+
+        print(
+            f"Exported {len(rows)} rows "
+            f"(Content-Encoding: {response.headers.get('Content-Encoding')})"
+        )
+        if document_id in [row["id"] for row in rows]:
+            print("✅ Uploaded document present in export")
+        else:
+            print("❌ Uploaded document missing from export")
+
+        response = requests.get(
+            url, params={"since": document_id, "format": "csv"}, timeout=30
+        )
+        remaining = len(response.text.splitlines()) - 1
+        print(f"Resumed CSV export after ID {document_id}: {remaining} rows")
+
+    except requests.RequestException as e:
+        print(f"Export request failed: {e}")
+
+
 def test_client_isolation(document_id):
     """Test that clients cannot access other clients' documents"""
     if not document_id:
@@ -136,6 +226,8 @@ def main():
     # Test document upload
     document_id = test_upload_document()
     test_retrieve_metadata(document_id)
+    test_sparse_fields(document_id)
+    test_export(document_id)
 
     test_client_isolation(document_id)
 